@@ -1,87 +1,110 @@
 import json
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
 
-@pytest.fixture
-def temp_docs_dir(tmp_path: Path) -> Path:
-    docs_dir = tmp_path / "docs"
-    docs_dir.mkdir()
-
-    (docs_dir / "basic_info.md").write_text("# Basic Info\nTest content")
-
+def _base_doc_files(docs_dir: Path) -> list[tuple[Path, str]]:
     integration_patterns = docs_dir / "integration_patterns"
-    integration_patterns.mkdir()
-    (integration_patterns / "list.md").write_text(
-        "| pattern_id | description |\n| --- | --- |\n| test/pattern1 | Test pattern 1 |\n"
-    )
-    test_category = integration_patterns / "test"
-    test_category.mkdir()
-    (test_category / "pattern1.md").write_text("---\ntitle: Test Pattern\n---\n# Test Pattern\nContent")
-
     troubleshooting = docs_dir / "troubleshooting"
-    troubleshooting.mkdir()
-    (troubleshooting / "list.md").write_text(
-        "| guide_id | description |\n| --- | --- |\n| errors/timeout | Timeout errors guide |\n"
-    )
-    errors_dir = troubleshooting / "errors"
-    errors_dir.mkdir()
-    (errors_dir / "timeout.md").write_text("# Timeout Errors\nGuide content")
-
-    return docs_dir
-
-
-@pytest.fixture
-def temp_provider_docs(temp_docs_dir: Path) -> Path:
-    omelet_dir = temp_docs_dir / "omelet"
-    omelet_dir.mkdir()
-
-    (omelet_dir / "endpoints_summary.md").write_text(
-        "# Omelet Routing Engine API\n"
-        "## Endpoints\n"
-        "| Path | Method | Summary | Description |\n"
-        "|------|--------|---------|-------------|\n"
-        "| /api/vrp | POST | VRP endpoint | Solve VRP problems |\n"
-        "| /api/cost-matrix | POST | Cost matrix | Generate cost matrix |\n"
-    )
-
-    overviews = omelet_dir / "overviews"
-    overviews.mkdir()
-    (overviews / "vrp.json").write_text(
-        json.dumps(
-            {
-                "path": "/api/vrp",
-                "method": "POST",
-                "summary": "VRP endpoint",
-                "description": "Solve VRP problems",
-            }
-        )
-    )
-
+    return [
+        (docs_dir / "basic_info.md", "# Basic Info\nTest content"),
+        (
+            integration_patterns / "list.md",
+            "| pattern_id | description |\n| --- | --- |\n| test/pattern1 | Test pattern 1 |\n",
+        ),
+        (
+            integration_patterns / "test" / "pattern1.md",
+            "---\ntitle: Test Pattern\n---\n# Test Pattern\nContent",
+        ),
+        (
+            troubleshooting / "list.md",
+            "| guide_id | description |\n| --- | --- |\n| errors/timeout | Timeout errors guide |\n",
+        ),
+        (troubleshooting / "errors" / "timeout.md", "# Timeout Errors\nGuide content"),
+    ]
+
+
+def _provider_doc_files(docs_dir: Path) -> list[tuple[Path, str]]:
+    omelet_dir = docs_dir / "omelet"
     schemas = omelet_dir / "schemas"
-    schemas.mkdir()
-    request_body = schemas / "request_body"
-    request_body.mkdir()
-    (request_body / "vrp.json").write_text(json.dumps({"schema": {"type": "object"}}))
+    examples = omelet_dir / "examples"
+    return [
+        (
+            omelet_dir / "endpoints_summary.md",
+            "# Omelet Routing Engine API\n"
+            "## Endpoints\n"
+            "| Path | Method | Summary | Description |\n"
+            "|------|--------|---------|-------------|\n"
+            "| /api/vrp | POST | VRP endpoint | Solve VRP problems |\n"
+            "| /api/cost-matrix | POST | Cost matrix | Generate cost matrix |\n",
+        ),
+        (
+            omelet_dir / "overviews" / "vrp.json",
+            json.dumps(
+                {
+                    "path": "/api/vrp",
+                    "method": "POST",
+                    "summary": "VRP endpoint",
+                    "description": "Solve VRP problems",
+                }
+            ),
+        ),
+        (schemas / "request_body" / "vrp.json", json.dumps({"schema": {"type": "object"}})),
+        (schemas / "response" / "vrp" / "200.json", json.dumps({"type": "object", "properties": {}})),
+        (examples / "request_body" / "vrp" / "default.json", json.dumps({"vehicles": [], "jobs": []})),
+        (examples / "response_body" / "vrp" / "200" / "success.json", json.dumps({"routes": []})),
+    ]
+
+
+@pytest.fixture(scope="session")
+def _docs_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Materialize the shared docs tree once per session; tests link from it."""
+    template = tmp_path_factory.mktemp("docs_template") / "docs"
+    template.mkdir()
+
+    files = _base_doc_files(template) + _provider_doc_files(template)
+    for path, _ in files:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+    # write() releases the GIL, so a small pool overlaps the file writes
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda item: item[0].write_text(item[1]), files))
+
+    return template
+
+
+def _link_tree(source: Path, destination: Path, skip: set[str] | None = None) -> None:
+    """Recreate a directory tree using hardlinks (one inode op per file)."""
+    destination.mkdir(parents=True, exist_ok=True)
+    for entry in source.iterdir():
+        if skip and entry.name in skip:
+            continue
+        target = destination / entry.name
+        if entry.is_dir():
+            _link_tree(entry, target)
+        else:
+            try:
+                os.link(entry, target)
+            except OSError:  # pragma: no cover - filesystem without hardlink support
+                shutil.copy2(entry, target)
 
-    response = schemas / "response"
-    response.mkdir()
-    vrp_response = response / "vrp"
-    vrp_response.mkdir()
-    (vrp_response / "200.json").write_text(json.dumps({"type": "object", "properties": {}}))
 
-    examples = omelet_dir / "examples"
-    examples.mkdir()
-    req_body_examples = examples / "request_body" / "vrp"
-    req_body_examples.mkdir(parents=True)
-    (req_body_examples / "default.json").write_text(json.dumps({"vehicles": [], "jobs": []}))
+@pytest.fixture
+def temp_docs_dir(_docs_template: Path, tmp_path: Path) -> Path:
+    docs_dir = tmp_path / "docs"
+    _link_tree(_docs_template, docs_dir, skip={"omelet"})
+    return docs_dir
 
-    resp_body_examples = examples / "response_body" / "vrp" / "200"
-    resp_body_examples.mkdir(parents=True)
-    (resp_body_examples / "success.json").write_text(json.dumps({"routes": []}))
 
-    return temp_docs_dir
+@pytest.fixture
+def temp_provider_docs(_docs_template: Path, tmp_path: Path) -> Path:
+    docs_dir = tmp_path / "docs"
+    _link_tree(_docs_template, docs_dir)
+    return docs_dir
 
 
 @pytest.fixture
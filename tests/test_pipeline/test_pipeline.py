@@ -0,0 +1,94 @@
+import json
+import os
+from pathlib import Path
+
+import httpx
+import pytest
+
+from tms_mcp.pipeline import pipeline
+from tms_mcp.pipeline.pipeline import _spec_cache_path, _spec_meta_path, fetch_and_resolve_spec
+
+pytestmark = pytest.mark.asyncio
+
+SPEC_URL = "https://example.test/openapi.json"
+SPEC_BODY = {"openapi": "3.0.0", "info": {"title": "Test API", "version": "1.0.0"}, "paths": {}}
+
+
+@pytest.fixture
+def spec_cache_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Point the spec cache at a temp directory with caching enabled."""
+    cache_dir = tmp_path / "spec_cache"
+    monkeypatch.setattr(pipeline.settings, "SPEC_CACHE_DIR", cache_dir)
+    monkeypatch.setattr(pipeline.settings, "SPEC_CACHE_TTL", 3600)
+    return cache_dir
+
+
+def _mock_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _backdate_cache(url: str, age_seconds: float) -> None:
+    """Push the cached spec's mtime into the past so the TTL check sees it as stale."""
+    cache_path = _spec_cache_path(url)
+    stale_time = cache_path.stat().st_mtime - age_seconds
+    os.utime(cache_path, (stale_time, stale_time))
+
+
+class TestFetchAndResolveSpecCache:
+    async def test_200_populates_cache(self, spec_cache_dir: Path) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=SPEC_BODY, headers={"ETag": '"v1"'})
+
+        async with _mock_client(handler) as client:
+            result = await fetch_and_resolve_spec(SPEC_URL, client)
+
+        assert result == SPEC_BODY
+        assert json.loads(_spec_cache_path(SPEC_URL).read_text()) == SPEC_BODY
+        assert json.loads(_spec_meta_path(SPEC_URL).read_text()) == {"etag": '"v1"'}
+
+    async def test_fresh_cache_hit_skips_network(self, spec_cache_dir: Path) -> None:
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=SPEC_BODY)
+
+        async with _mock_client(handler) as client:
+            first = await fetch_and_resolve_spec(SPEC_URL, client)
+            second = await fetch_and_resolve_spec(SPEC_URL, client)
+
+        assert first == second == SPEC_BODY
+        assert len(requests) == 1
+
+    async def test_stale_cache_revalidated_with_304(self, spec_cache_dir: Path) -> None:
+        conditional_headers: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            conditional_headers.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json=SPEC_BODY, headers={"ETag": '"v1"'})
+
+        async with _mock_client(handler) as client:
+            await fetch_and_resolve_spec(SPEC_URL, client)
+            _backdate_cache(SPEC_URL, pipeline.settings.SPEC_CACHE_TTL + 1)
+            stale_mtime = _spec_cache_path(SPEC_URL).stat().st_mtime
+            result = await fetch_and_resolve_spec(SPEC_URL, client)
+
+        assert result == SPEC_BODY
+        assert conditional_headers == [None, '"v1"']
+        # The 304 restarts the TTL window instead of leaving the cache stale
+        assert _spec_cache_path(SPEC_URL).stat().st_mtime > stale_mtime
+
+    async def test_stale_cache_used_when_refetch_fails(self, spec_cache_dir: Path) -> None:
+        responses = iter([httpx.Response(200, json=SPEC_BODY), httpx.Response(404)])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return next(responses)
+
+        async with _mock_client(handler) as client:
+            await fetch_and_resolve_spec(SPEC_URL, client)
+            _backdate_cache(SPEC_URL, pipeline.settings.SPEC_CACHE_TTL + 1)
+            result = await fetch_and_resolve_spec(SPEC_URL, client)
+
+        assert result == SPEC_BODY
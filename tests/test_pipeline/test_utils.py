@@ -179,6 +179,8 @@ class TestAtomicDirectoryReplace:
     def test_rollback_on_rename_failure(self, tmp_path: Path) -> None:
         from unittest.mock import patch
 
+        from tms_mcp.pipeline import utils
+
         source = tmp_path / "source"
         target = tmp_path / "target"
 
@@ -197,7 +199,8 @@ class TestAtomicDirectoryReplace:
                 raise OSError("Simulated rename failure")
             return original_rename(self, target_path)
 
-        with patch.object(Path, "rename", failing_rename):
+        # Disable the renameat2 exchange fast path to exercise the rename fallback
+        with patch.object(utils, "_renameat2", None), patch.object(Path, "rename", failing_rename):
             result = atomic_directory_replace(source, target)
 
         assert result is False
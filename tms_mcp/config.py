@@ -1,3 +1,5 @@
+from functools import lru_cache
+from pathlib import Path
 from typing import Literal
 
 from pydantic import BaseModel, Field
@@ -83,6 +85,16 @@ class Settings(BaseSettings):
         description="Automatically update documentation on server startup. Falls back to existing docs if update fails.",
     )
 
+    # Spec caching
+    SPEC_CACHE_TTL: int = Field(
+        default=0,
+        description="Seconds to serve provider OpenAPI specs from the on-disk cache; 0 disables caching",
+    )
+    SPEC_CACHE_DIR: Path = Field(
+        default=Path.home() / ".tms_mcp" / "cache",
+        description="Directory for cached resolved OpenAPI specs",
+    )
+
     # Example generation
     EXAMPLE_LENGTH_LIMIT: int = Field(
         default=3,
@@ -103,4 +115,15 @@ class Settings(BaseSettings):
         self.pipeline_config.provider_configs["inavi"].docs_url = self.IMAPS_API_DOCS_URL
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Construct the application settings once per process."""
+    return Settings()
+
+
+def __getattr__(name: str) -> Settings:
+    # Lazily materialize the module-level `settings` singleton so importing this
+    # module doesn't re-read .env and re-run validators until settings are used.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,6 +3,9 @@
 Endpoint documentation generators.
 """
 
+import asyncio
+from dataclasses import asdict
+from pathlib import Path
 from typing import Any
 
 from ...config import settings
@@ -12,11 +15,14 @@ from ..utils import (
     get_endpoint_filename,
     get_provider_from_path,
     safe_remove_directory,
-    write_json_file,
+    write_json_file_async,
     write_markdown_file,
 )
 from .base import BaseGenerator
 
+# Bound concurrent overview writes to avoid file-descriptor exhaustion
+_MAX_CONCURRENT_WRITES = 64
+
 
 class EndpointGenerator(BaseGenerator):
     """Generator for endpoint summaries and overviews."""
@@ -25,12 +31,53 @@ class EndpointGenerator(BaseGenerator):
         """
         Generate endpoint documentation.
 
+        Walks the spec once, accumulating summary rows and scheduling overview
+        writes from the same traversal instead of iterating the tree twice.
+
         Args:
             spec: OpenAPI specification
             provider: Optional provider
         """
-        await self.generate_endpoints_summary(spec, provider)
-        await self.generate_endpoint_overviews(spec, provider)
+        overviews_path = self.get_output_path(provider, "overviews")
+
+        # Clean existing overviews
+        safe_remove_directory(overviews_path)
+        overviews_path.mkdir(parents=True, exist_ok=True)
+
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_WRITES)
+
+        async def write_overview(file_path: Path, endpoint_info: EndpointInfo) -> None:
+            async with semaphore:
+                await write_json_file_async(file_path, asdict(endpoint_info), indent=False)
+
+        rows: list[tuple[str, str, str, str]] = []
+        # Overview filenames are keyed by path only, so multiple methods on one path
+        # map to the same file; dedupe by target (last method wins, as it did when
+        # the writes were sequential) before fanning out concurrent writes.
+        overview_targets: dict[Path, EndpointInfo] = {}
+        rows_append = rows.append  # avoid per-iteration attribute lookups in the hot loop
+        for path, method, method_data in self._walk_spec(spec):
+            method_data_get = method_data.get
+            rows_append((path, method.upper(), method_data_get("summary", ""), method_data_get("description", "None")))
+
+            endpoint_info = self._extract_endpoint_info(path, method, method_data)
+            current_provider = provider if provider is not None else self._get_provider_from_path(path)
+            filename = get_endpoint_filename(current_provider, path)
+            overview_targets[overviews_path / filename] = endpoint_info
+
+        if overview_targets:
+            await asyncio.gather(*(write_overview(fp, info) for fp, info in overview_targets.items()))
+        self.log_progress(f"Generated endpoint overviews in {overviews_path}")
+
+        self._write_endpoints_summary(rows, provider)
+
+    @staticmethod
+    def _walk_spec(spec: OpenAPISpec):
+        """Yield (path, method, method_data) for every operation in the spec."""
+        for path, path_data in spec.paths.items():
+            for method, method_data in path_data.items():
+                if isinstance(method_data, dict):
+                    yield path, method, method_data
 
     async def generate_endpoints_summary(self, spec: OpenAPISpec, provider: str | None = None) -> None:
         """
@@ -40,8 +87,10 @@ class EndpointGenerator(BaseGenerator):
             spec: OpenAPI specification
             provider: Optional provider name
         """
-        rows = self._extract_endpoint_rows(spec)
+        self._write_endpoints_summary(self._extract_endpoint_rows(spec), provider)
 
+    def _write_endpoints_summary(self, rows: list[tuple[str, str, str, str]], provider: str | None) -> None:
+        """Render and write the endpoints summary markdown from collected rows."""
         if not rows:
             self.log_progress(f"No endpoints found for provider: {provider}", "warning")
             return
@@ -78,41 +127,32 @@ class EndpointGenerator(BaseGenerator):
         safe_remove_directory(overviews_path)
         overviews_path.mkdir(parents=True, exist_ok=True)
 
-        paths = spec.paths
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_WRITES)
 
-        for path, path_data in paths.items():
-            for method, method_data in path_data.items():
-                if not isinstance(method_data, dict):
-                    continue
+        async def write_overview(file_path: Path, endpoint_info: EndpointInfo) -> None:
+            async with semaphore:
+                await write_json_file_async(file_path, asdict(endpoint_info), indent=False)
 
-                endpoint_info = self._extract_endpoint_info(path, method, method_data)
+        # Dedupe by target file: methods sharing a path share an overview filename
+        overview_targets: dict[Path, EndpointInfo] = {}
+        for path, method, method_data in self._walk_spec(spec):
+            endpoint_info = self._extract_endpoint_info(path, method, method_data)
 
-                current_provider = provider
-                if current_provider is None:
-                    current_provider = self._get_provider_from_path(path)
+            current_provider = provider if provider is not None else self._get_provider_from_path(path)
+            filename = get_endpoint_filename(current_provider, path)
+            overview_targets[overviews_path / filename] = endpoint_info
 
-                filename = get_endpoint_filename(current_provider, path)
-                file_path = overviews_path / filename
-
-                write_json_file(file_path, endpoint_info.__dict__)
+        if overview_targets:
+            await asyncio.gather(*(write_overview(fp, info) for fp, info in overview_targets.items()))
 
         self.log_progress(f"Generated endpoint overviews in {overviews_path}")
 
     def _extract_endpoint_rows(self, spec: OpenAPISpec) -> list[tuple[str, str, str, str]]:
         """Extract endpoint information for summary table, including HTTP method."""
-        rows = []
-        paths = spec.paths
-
-        for path, path_data in paths.items():
-            for method, method_data in path_data.items():
-                if not isinstance(method_data, dict):
-                    continue
-
-                summary = method_data.get("summary", "")
-                description = method_data.get("description", "None")
-                rows.append((path, method.upper(), summary, description))
-
-        return rows
+        return [
+            (path, method.upper(), method_data.get("summary", ""), method_data.get("description", "None"))
+            for path, method, method_data in self._walk_spec(spec)
+        ]
 
     def _get_provider_info(self, provider: str | None) -> tuple[str, str]:
         """Get provider-specific title and base URL."""
@@ -146,13 +186,12 @@ class EndpointGenerator(BaseGenerator):
             ]
         )
 
-        # Add rows to table
-        for path, method, summary, description in rows:
-            path_escaped = escape_markdown_table_content(path)
-            method_escaped = escape_markdown_table_content(method)
-            summary_escaped = escape_markdown_table_content(summary)
-            description_escaped = escape_markdown_table_content(description)
-            lines.append(f"| {path_escaped} | {method_escaped} | {summary_escaped} | {description_escaped} |")
+        # Add rows to table in one pass; escape is a single C-level translate
+        escape = escape_markdown_table_content
+        lines.extend(
+            f"| {escape(path)} | {escape(method)} | {escape(summary)} | {escape(description)} |"
+            for path, method, summary, description in rows
+        )
 
         return "\n".join(lines)
 
@@ -1,13 +1,18 @@
 #!/usr/bin/env python3
 """Example generation for request and response bodies from OpenAPI spec."""
 
+import asyncio
+from pathlib import Path
 from typing import Any
 
 from ...config import settings
 from ..models import OpenAPISpec
-from ..utils import ensure_directory, write_json_file
+from ..utils import ensure_directory, write_json_file_async
 from .base import BaseGenerator
 
+# Bound concurrent example writes to avoid file-descriptor exhaustion
+_MAX_CONCURRENT_WRITES = 64
+
 
 class ExampleGenerator(BaseGenerator):
     """Generator for request and response body examples."""
@@ -21,49 +26,66 @@ class ExampleGenerator(BaseGenerator):
             provider: Optional provider
         """
         self.log_progress(f"Generating examples for {provider}...")
+        # Example filenames carry no method component, so two methods on one path can
+        # produce the same target; dedupe by file (last one wins, as it did when the
+        # saves were sequential) before fanning out concurrent writes.
+        targets: dict[Path, tuple[str, Any]] = {}
         for path, path_item in spec.paths.items():
-            for method, operation in path_item.items():
+            for _method, operation in path_item.items():
                 if "requestBody" in operation:
-                    self._extract_examples(
-                        operation["requestBody"],
-                        "request_body",
-                        path,
-                        method,
-                        provider,
-                    )
-                if "responses" in operation:
-                    for status_code, response in operation["responses"].items():
+                    targets.update(
                         self._extract_examples(
-                            response,
-                            "response_body",
+                            operation["requestBody"],
+                            "request_body",
                             path,
-                            method,
                             provider,
-                            status_code=status_code,
                         )
+                    )
+                if "responses" in operation:
+                    for status_code, response in operation["responses"].items():
+                        targets.update(
+                            self._extract_examples(
+                                response,
+                                "response_body",
+                                path,
+                                provider,
+                                status_code=status_code,
+                            )
+                        )
+
+        if targets:
+            semaphore = asyncio.Semaphore(_MAX_CONCURRENT_WRITES)
+
+            async def bounded(file_path: Path, example_name: str, example_data: Any) -> None:
+                async with semaphore:
+                    await self._save_example(file_path, example_name, example_data)
+
+            await asyncio.gather(*(bounded(fp, name, data) for fp, (name, data) in targets.items()))
 
     def _extract_examples(
         self,
         content_owner: dict[str, Any],
         example_type: str,
         path: str,
-        method: str,
         provider: str | None,
         status_code: str | None = None,
-    ) -> None:
+    ) -> dict[Path, tuple[str, Any]]:
         """
-        Extract and save examples from a part of the OpenAPI spec.
+        Collect example save targets found in a part of the OpenAPI spec.
 
         Args:
             content_owner: The object that contains the 'content' field.
             example_type: 'request_body' or 'response_body'.
             path: The endpoint path.
-            method: The HTTP method.
             provider: The provider name.
             status_code: The HTTP status code for responses.
+
+        Returns:
+            Mapping of target file to (example name, example data).
         """
+        targets: dict[Path, tuple[str, Any]] = {}
         if "content" not in content_owner:
-            return
+            return targets
 
         for content_type, content_details in content_owner["content"].items():
             if "application/json" not in content_type:
@@ -71,29 +93,17 @@ class ExampleGenerator(BaseGenerator):
 
             # Handle single 'example'
             if "example" in content_details:
-                self._save_example(
-                    content_details["example"],
-                    "default",
-                    example_type,
-                    path,
-                    method,
-                    provider,
-                    status_code=status_code,
-                )
+                file_path = self._example_file_path("default", example_type, path, provider, status_code)
+                targets[file_path] = ("default", content_details["example"])
 
             # Handle multiple 'examples'
             if "examples" in content_details:
                 for example_name, example_details in content_details["examples"].items():
                     if "value" in example_details:
-                        self._save_example(
-                            example_details["value"],
-                            example_name,
-                            example_type,
-                            path,
-                            method,
-                            provider,
-                            status_code=status_code,
-                        )
+                        file_path = self._example_file_path(example_name, example_type, path, provider, status_code)
+                        targets[file_path] = (example_name, example_details["value"])
+
+        return targets
 
     def _truncate_lists(self, data: object, limit: int) -> object:
         if isinstance(data, list):
@@ -103,27 +113,26 @@ class ExampleGenerator(BaseGenerator):
             return {k: self._truncate_lists(v, limit) for k, v in data.items()}
         return data
 
-    def _save_example(
+    def _example_file_path(
         self,
-        example_data: dict,
         example_name: str,
         example_type: str,
         path: str,
-        method: str,
         provider: str | None,
-        status_code: str | None = None,
-    ) -> None:
+        status_code: str | None,
+    ) -> Path:
         """
-        Save an example to a file.
+        Compute the target file for an example.
 
         Args:
-            example_data: The example data to save.
             example_name: The name of the example.
             example_type: 'request_body' or 'response_body'.
             path: The endpoint path.
-            method: The HTTP method.
             provider: The provider name.
             status_code: The HTTP status code for responses.
+
+        Returns:
+            Path the example will be saved to.
         """
         # Get path prefix from settings
         path_prefix = ""
@@ -134,19 +143,26 @@ class ExampleGenerator(BaseGenerator):
         if path_prefix and path.startswith(path_prefix):
             path = path[len(path_prefix) :]
 
-        # Sanitize path and method for filename
+        # Sanitize path for filename
         sane_path = path.replace("/", "_").strip("_")
 
-        # Create a directory for the endpoint
         if example_type == "response_body" and status_code:
             endpoint_dir = self.get_output_path(provider, f"examples/{example_type}/{sane_path}/{status_code}")
         else:
             endpoint_dir = self.get_output_path(provider, f"examples/{example_type}/{sane_path}")
-        ensure_directory(endpoint_dir)
 
-        # Create the filename
-        example_filename = f"{example_name}.json"
-        example_file_path = endpoint_dir / example_filename
+        return endpoint_dir / f"{example_name}.json"
+
+    async def _save_example(self, example_file_path: Path, example_name: str, example_data: Any) -> None:
+        """
+        Save an example to a file.
+
+        Args:
+            example_file_path: Target file for the example.
+            example_name: The name of the example.
+            example_data: The example data to save.
+        """
+        ensure_directory(example_file_path.parent)
 
         # Recursively truncate any lists in the data to the configured limit
         limit = getattr(settings, "EXAMPLE_LENGTH_LIMIT", None)
@@ -156,5 +172,5 @@ class ExampleGenerator(BaseGenerator):
             data_to_save = example_data
 
         # Save the example
-        write_json_file(example_file_path, data_to_save)
+        await write_json_file_async(example_file_path, data_to_save, indent=False)
         self.log_progress(f"Saved example '{example_name}' to {example_file_path}")
@@ -3,14 +3,18 @@
 Schema generators for request and response bodies.
 """
 
-import copy
+import asyncio
+from pathlib import Path
 from typing import Any
 
 from ...config import settings
 from ..models import OpenAPISpec
-from ..utils import get_endpoint_filename, get_provider_from_path, safe_remove_directory, write_json_file
+from ..utils import get_endpoint_filename, get_provider_from_path, safe_remove_directory, write_json_file_async
 from .base import BaseGenerator
 
+# Bound concurrent schema writes to avoid file-descriptor exhaustion
+_MAX_CONCURRENT_WRITES = 64
+
 
 class SchemaGenerator(BaseGenerator):
     """Generator for request and response schemas."""
@@ -43,6 +47,8 @@ class SchemaGenerator(BaseGenerator):
 
         paths = spec.paths
 
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_WRITES)
+        tasks = []
         for path, path_data in paths.items():
             for method, method_data in path_data.items():
                 if method.lower() != "post" or not isinstance(method_data, dict):
@@ -66,10 +72,19 @@ class SchemaGenerator(BaseGenerator):
                 filename = get_endpoint_filename(current_provider, path)
                 file_path = request_body_path / filename
 
-                write_json_file(file_path, schema_to_save)
+                tasks.append(self._write_schema(semaphore, file_path, schema_to_save))
+
+        if tasks:
+            await asyncio.gather(*tasks)
 
         self.log_progress(f"Generated request body schemas in {request_body_path}")
 
+    @staticmethod
+    async def _write_schema(semaphore: asyncio.Semaphore, file_path: Path, data: dict[str, Any]) -> None:
+        """Write one schema file under the shared concurrency bound."""
+        async with semaphore:
+            await write_json_file_async(file_path, data, indent=False)
+
     async def generate_response_schemas(self, spec: OpenAPISpec, provider: str | None = None) -> None:
         """
         Generate response schemas from the OpenAPI specification.
@@ -87,6 +102,10 @@ class SchemaGenerator(BaseGenerator):
 
         paths = spec.paths
 
+        # Response files are keyed by path_id and code only, so two methods on one
+        # path sharing a response code map to the same file; dedupe by target (last
+        # method wins, as with the old sequential writes) before gathering.
+        targets: dict[Path, dict[str, Any]] = {}
         for path, path_data in paths.items():
             for method, method_data in path_data.items():
                 if not isinstance(method_data, dict):
@@ -109,9 +128,13 @@ class SchemaGenerator(BaseGenerator):
 
                     response_schema = self._extract_response_schema(response_data)
                     if response_schema:
-                        filename = f"{response_code}.json"
-                        file_path = path_dir / filename
-                        write_json_file(file_path, response_schema)
+                        targets[path_dir / f"{response_code}.json"] = response_schema
+
+        if targets:
+            semaphore = asyncio.Semaphore(_MAX_CONCURRENT_WRITES)
+            await asyncio.gather(
+                *(self._write_schema(semaphore, file_path, schema) for file_path, schema in targets.items())
+            )
 
         self.log_progress(f"Generated response schemas in {response_path}")
 
@@ -133,8 +156,9 @@ class SchemaGenerator(BaseGenerator):
         Returns:
             Schema with metadata attached
         """
-        # Only persist the JSON Schema, excluding any examples or other fields
-        schema_only: dict[str, Any] = {"schema": copy.deepcopy(app_json.get("schema"))}
+        # Only persist the JSON Schema, excluding any examples or other fields.
+        # A shallow wrap is enough: the subtree is serialized immediately and never mutated.
+        schema_only: dict[str, Any] = {"schema": app_json.get("schema")}
 
         # Intentionally do not include examples or metadata to keep only the schema
         return schema_only
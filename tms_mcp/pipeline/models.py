@@ -4,6 +4,7 @@ Data models and enums for the OpenAPI indexing pipeline_config.
 """
 
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -30,7 +31,7 @@ class FileConstants:
 file_constants = FileConstants()
 
 
-@dataclass
+@dataclass(slots=True)
 class EndpointInfo:
     """Information about an API endpoint."""
 
@@ -41,7 +42,7 @@ class EndpointInfo:
     parameters: list[dict[str, Any]] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemaMetadata:
     """Metadata for a schema."""
 
@@ -50,7 +51,7 @@ class SchemaMetadata:
     method: str
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationResult:
     """Result from generating documentation or examples."""
 
@@ -64,7 +65,7 @@ class GenerationResult:
     api_verification_error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineConfig:
     """Configuration for the entire pipeline_config."""
 
@@ -75,6 +76,7 @@ class PipelineConfig:
     parallel_generation: bool = True
 
 
+# No slots here: cached_property stores its result in the instance __dict__
 @dataclass
 class OpenAPISpec:
     """Represents an OpenAPI specification."""
@@ -82,17 +84,17 @@ class OpenAPISpec:
     data: dict[str, Any]
     provider: str | None = None
 
-    @property
+    @cached_property
     def paths(self) -> dict[str, Any]:
         """Get paths from the spec."""
         return self.data.get("paths", {})
 
-    @property
+    @cached_property
     def info(self) -> dict[str, Any]:
         """Get info from the spec."""
         return self.data.get("info", {})
 
-    @property
+    @cached_property
     def tags(self) -> list[dict[str, Any]]:
         """Get tags from the spec."""
         return self.data.get("tags", [])
@@ -6,8 +6,13 @@ Handles the indexing of OpenAPI specifications of Omelet's Routing Engine API
 
 import argparse
 import asyncio
+import hashlib
+import json
+import os
 import shutil
 import tempfile
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -22,11 +27,13 @@ from .utils import (
     atomic_directory_replace,
     escape_markdown_table_content,
     load_markdown_with_front_matter,
+    read_json_file,
     write_json_file,
     write_markdown_file,
 )
 
 HTTP_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=16)
 MAX_RETRIES = 3
 RETRY_BACKOFF_BASE = 2
 RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
@@ -41,11 +48,17 @@ def _is_retryable_status(status_code: int) -> bool:
     return status_code in RETRYABLE_STATUS_CODES
 
 
-async def _fetch_with_retry(client: httpx.AsyncClient, url: str) -> httpx.Response:
+async def _fetch_with_retry(
+    client: httpx.AsyncClient, url: str, headers: dict[str, str] | None = None
+) -> httpx.Response:
     last_exception: Exception | None = None
     for attempt in range(MAX_RETRIES):
         try:
-            resp = await client.get(url, timeout=HTTP_TIMEOUT)
+            resp = await client.get(url, timeout=HTTP_TIMEOUT, headers=headers)
+            if resp.status_code == 304:
+                # Not an error: a conditional GET answers 304 when the cached copy
+                # is still valid, and raise_for_status() would reject any non-2xx.
+                return resp
             resp.raise_for_status()
             return resp
         except httpx.HTTPStatusError as e:
@@ -65,58 +78,149 @@ async def _fetch_with_retry(client: httpx.AsyncClient, url: str) -> httpx.Respon
     raise RuntimeError("Unexpected state in retry loop")
 
 
-async def fetch_and_resolve_spec(url: str) -> dict[str, Any] | None:
-    async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
-        try:
-            resp = await _fetch_with_retry(client, url)
-            json_text = resp.text
-            resolved = jsonref.loads(json_text)
-            if isinstance(resolved, dict):
-                return resolved
-            logger.error(f"OpenAPI spec from {url} is not a valid JSON object")
-            return None
-        except httpx.TimeoutException:
-            logger.error(f"Timeout fetching OpenAPI from {url} after {MAX_RETRIES} retries")
-            return None
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error fetching OpenAPI from {url}: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Failed to fetch or resolve OpenAPI from {url}: {e}")
+def _spec_cache_path(url: str) -> Path:
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+    return Path(settings.SPEC_CACHE_DIR).expanduser() / f"{digest}.json"
+
+
+def _spec_meta_path(url: str) -> Path:
+    return _spec_cache_path(url).with_suffix(".meta.json")
+
+
+def _load_cached_spec(url: str, max_age: float | None) -> dict[str, Any] | None:
+    """Return the cached resolved spec for a URL, optionally requiring it fresher than max_age seconds."""
+    cache_path = _spec_cache_path(url)
+    try:
+        if max_age is not None and time.time() - cache_path.stat().st_mtime >= max_age:
             return None
+        cached = read_json_file(cache_path)
+    except (OSError, json.JSONDecodeError):
+        return None
+    return cached if isinstance(cached, dict) else None
+
+
+def _load_spec_validators(url: str) -> dict[str, str]:
+    """Load the stored ETag/Last-Modified validators for a cached spec."""
+    try:
+        meta = read_json_file(_spec_meta_path(url))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return meta if isinstance(meta, dict) else {}
+
 
+def _store_cached_spec(url: str, spec_data: dict[str, Any], response_headers: httpx.Headers) -> None:
+    try:
+        write_json_file(_spec_cache_path(url), spec_data, indent=False)
+        validators = {
+            name: value
+            for name, value in (
+                ("etag", response_headers.get("etag")),
+                ("last_modified", response_headers.get("last-modified")),
+            )
+            if value
+        }
+        if validators:
+            write_json_file(_spec_meta_path(url), validators)
+    except (TypeError, OSError) as e:
+        logger.warning(f"Failed to cache resolved spec for {url}: {e}")
+
+
+async def fetch_and_resolve_spec(url: str, client: httpx.AsyncClient) -> dict[str, Any] | None:
+    cache_ttl = settings.SPEC_CACHE_TTL
+    stale_cached: dict[str, Any] | None = None
+    headers: dict[str, str] = {}
+    if cache_ttl > 0:
+        cached = _load_cached_spec(url, cache_ttl)
+        if cached is not None:
+            logger.info(f"   ♻️ Using cached OpenAPI spec for {url}")
+            return cached
+
+        # Stale cache: revalidate with a conditional GET so an unchanged spec
+        # comes back as a bodyless 304 instead of a full download
+        stale_cached = _load_cached_spec(url, None)
+        if stale_cached is not None:
+            validators = _load_spec_validators(url)
+            if etag := validators.get("etag"):
+                headers["If-None-Match"] = etag
+            if last_modified := validators.get("last_modified"):
+                headers["If-Modified-Since"] = last_modified
 
-async def get_provider_spec(provider: str) -> OpenAPISpec | None:
+    try:
+        resp = await _fetch_with_retry(client, url, headers or None)
+        if resp.status_code == 304 and stale_cached is not None:
+            try:
+                os.utime(_spec_cache_path(url))  # restart the TTL window
+            except OSError:
+                pass
+            logger.info(f"   ♻️ OpenAPI spec for {url} unchanged upstream (304); using cached copy")
+            return stale_cached
+        # Parse the raw bytes directly; decoding to str first doubles peak memory.
+        # proxies=False materializes every $ref into a plain dict up front, so the
+        # generators traverse ordinary dicts instead of re-walking lazy JsonRef proxies.
+        # A spec without any $ref skips the resolver machinery entirely.
+        content = resp.content
+        if b'"$ref"' in content:
+            resolved = jsonref.loads(content, proxies=False, lazy_load=False)
+        else:
+            resolved = json.loads(content)
+        if isinstance(resolved, dict):
+            if cache_ttl > 0:
+                _store_cached_spec(url, resolved, resp.headers)
+            return resolved
+        logger.error(f"OpenAPI spec from {url} is not a valid JSON object")
+        return None
+    except httpx.TimeoutException:
+        if stale_cached is not None:
+            logger.warning(f"Timeout fetching OpenAPI from {url}; falling back to stale cached spec")
+            return stale_cached
+        logger.error(f"Timeout fetching OpenAPI from {url} after {MAX_RETRIES} retries")
+        return None
+    except httpx.HTTPStatusError as e:
+        if stale_cached is not None:
+            logger.warning(f"HTTP error fetching OpenAPI from {url}: {e}; falling back to stale cached spec")
+            return stale_cached
+        logger.error(f"HTTP error fetching OpenAPI from {url}: {e}")
+        return None
+    except Exception as e:
+        if stale_cached is not None:
+            logger.warning(f"Failed to fetch or resolve OpenAPI from {url}: {e}; falling back to stale cached spec")
+            return stale_cached
+        logger.error(f"Failed to fetch or resolve OpenAPI from {url}: {e}")
+        return None
+
+
+async def get_provider_spec(provider: str, client: httpx.AsyncClient) -> OpenAPISpec | None:
     """
     Fetch OpenAPI specification for a specific provider configuration.
 
     Args:
         provider: Provider name
+        client: Shared HTTP client used for the fetch
 
     Returns:
         OpenAPISpec for the provider or None if failed
     """
+    config = provider_configs[provider]
+
     # Check if URL is configured
-    if not provider_configs[provider].docs_url:
-        logger.warning(f"   ⚠️ No URL configured for {provider_configs[provider].name} provider")
+    if not config.docs_url:
+        logger.warning(f"   ⚠️ No URL configured for {config.name} provider")
         return None
 
     # Fetch and resolve spec
-    spec_data = await fetch_and_resolve_spec(provider_configs[provider].docs_url)
+    spec_data = await fetch_and_resolve_spec(config.docs_url, client)
     if not spec_data:
-        logger.warning(f"   ⚠️ Failed to fetch {provider_configs[provider].name} API spec")
+        logger.warning(f"   ⚠️ Failed to fetch {config.name} API spec")
         return None
 
     # Update title and description
     if "info" not in spec_data:
         spec_data["info"] = {}
-    spec_data["info"]["title"] = provider_configs[provider].title
-    spec_data["info"]["description"] = provider_configs[provider].description
+    spec_data["info"]["title"] = config.title
+    spec_data["info"]["description"] = config.description
 
-    logger.info(
-        f"   ✅ Fetched {provider_configs[provider].name} API spec with {len(spec_data.get('paths', {}))} endpoints"
-    )
-    return OpenAPISpec(data=spec_data, provider=provider_configs[provider].name)
+    logger.info(f"   ✅ Fetched {config.name} API spec with {len(spec_data.get('paths', {}))} endpoints")
+    return OpenAPISpec(data=spec_data, provider=config.name)
 
 
 async def get_provider_specs(providers: list[str] | None = None) -> dict[str, OpenAPISpec]:
@@ -134,27 +238,23 @@ async def get_provider_specs(providers: list[str] | None = None) -> dict[str, Op
 
     specs = {}
 
-    # Fetch specs for each provider
-    for provider in providers:
-        spec = await get_provider_spec(provider)
-        if spec:
-            specs[provider] = spec
+    # Fetch specs for all providers concurrently over one pooled client
+    async with httpx.AsyncClient(timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS) as client:
+        results = await asyncio.gather(
+            *(get_provider_spec(provider, client) for provider in providers), return_exceptions=True
+        )
+
+    for provider, result in zip(providers, results):
+        if isinstance(result, OpenAPISpec):
+            specs[provider] = result
+        elif isinstance(result, BaseException):
+            logger.error(f"   ❌ Failed to fetch spec for {provider}: {result}")
 
     return specs
 
 
-async def generate_basic_info(target_path: Path) -> None:
-    """
-    Generate the basic info of the OpenAPI JSON.
-    """
-    # Load template
-    template_path = Path(__file__).parent / "templates" / "basic_info.md.template"
-    if template_path.exists():
-        with open(template_path, "r", encoding="utf-8") as f:
-            content = f.read()
-    else:
-        # Fallback to default content if template doesn't exist
-        content = """## Overview
+# Fallback content used when the basic_info template is missing from the package
+_DEFAULT_BASIC_INFO = """## Overview
 This MCP server provides intelligent tools to explore two powerful APIs to build effective Transport Management Systems:
 
 ### 1. Omelet Routing Engine API
@@ -182,9 +282,23 @@ Comprehensive location and routing services including:
 - **iNavi**: Visit https://mapsapi.inavisys.com/ and setup payment to get an API key
 """
 
-    # Write the content to a file
+
+@lru_cache(maxsize=1)
+def _load_basic_info_template() -> str:
+    """Read the basic_info template once per process, falling back to the inline default."""
+    template_path = Path(__file__).parent / "templates" / "basic_info.md.template"
+    try:
+        return template_path.read_text(encoding="utf-8")
+    except OSError:
+        return _DEFAULT_BASIC_INFO
+
+
+async def generate_basic_info(target_path: Path) -> None:
+    """
+    Generate the basic info of the OpenAPI JSON.
+    """
     basic_info_path = target_path / "basic_info.md"
-    write_markdown_file(basic_info_path, content)
+    write_markdown_file(basic_info_path, _load_basic_info_template())
 
 
 def _extract_pattern_description(file_path: Path) -> str:
@@ -242,9 +356,9 @@ def generate_integration_patterns(target_path: Path) -> None:
         patterns.append((pattern_id, escape_markdown_table_content(description)))
 
     list_lines = ["| pattern_id | description |", "| --- | --- |"]
-
-    for pattern_id, description in sorted(patterns, key=lambda item: item[0]):
-        list_lines.append(f"| {pattern_id} | {description} |")
+    list_lines.extend(
+        f"| {pattern_id} | {description} |" for pattern_id, description in sorted(patterns, key=lambda item: item[0])
+    )
 
     write_markdown_file(output_dir / "list.md", "\n".join(list_lines))
     logger.info("   🧩 Generated integration pattern documentation and listing.")
@@ -281,14 +395,37 @@ def generate_troubleshooting_guides(target_path: Path) -> None:
         guides.append((guide_id, escape_markdown_table_content(description)))
 
     list_lines = ["| guide_id | description |", "| --- | --- |"]
-
-    for guide_id, description in sorted(guides, key=lambda item: item[0]):
-        list_lines.append(f"| {guide_id} | {description} |")
+    list_lines.extend(
+        f"| {guide_id} | {description} |" for guide_id, description in sorted(guides, key=lambda item: item[0])
+    )
 
     write_markdown_file(output_dir / "list.md", "\n".join(list_lines))
     logger.info("   🛠️ Generated troubleshooting documentation and listing.")
 
 
+def _reuse_existing_provider_docs(spec: OpenAPISpec, provider: str, temp_path: Path, target_path: Path) -> bool:
+    """
+    Copy the previously generated docs for a provider whose spec has not changed.
+
+    Returns:
+        True if the existing docs were reused, False if regeneration is needed.
+    """
+    existing_dir = target_path / provider
+    existing_spec_path = existing_dir / "openapi.json"
+    if not existing_spec_path.exists():
+        return False
+
+    try:
+        if read_json_file(existing_spec_path) != spec.data:
+            return False
+    except (json.JSONDecodeError, OSError):
+        return False
+
+    shutil.copytree(existing_dir, temp_path / provider)
+    logger.info(f"   ⏭️  Reused existing {provider} documentation (spec unchanged)")
+    return True
+
+
 async def process_provider_documentation(spec: OpenAPISpec, provider: str, temp_path: Path, target_path: Path) -> None:
     """
     Process documentation for a single provider.
@@ -306,16 +443,16 @@ async def process_provider_documentation(spec: OpenAPISpec, provider: str, temp_
     schema_gen = SchemaGenerator(temp_path)
     example_gen = ExampleGenerator(temp_path)
 
-    # Generate documentation in parallel
-    await asyncio.gather(
-        endpoint_gen.generate(spec, provider),
-        schema_gen.generate(spec, provider),
-        example_gen.generate(spec, provider),
-    )
+    # Generate documentation in parallel; TaskGroup cancels the siblings
+    # as soon as one generator fails instead of letting them run on
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(endpoint_gen.generate(spec, provider))
+        tg.create_task(schema_gen.generate(spec, provider))
+        tg.create_task(example_gen.generate(spec, provider))
 
     # Save provider-specific OpenAPI JSON
     provider_openapi_path = temp_path / provider / "openapi.json"
-    write_json_file(provider_openapi_path, spec.data)
+    write_json_file(provider_openapi_path, spec.data, indent=False)
 
     logger.info(f"   ✅ Completed {provider} documentation.")
 
@@ -353,8 +490,10 @@ async def run_openapi_indexing_pipeline(providers: list[str] | None = None) -> N
     # Target path for documentation
     target_path = Path(__file__).parent.parent / "docs"
 
-    # Use a temporary directory for the new documentation
-    with tempfile.TemporaryDirectory() as temp_dir_str:
+    # Use a temporary directory for the new documentation. Creating it next to the
+    # docs directory keeps the final swap a same-filesystem rename instead of a copy
+    # (the default /tmp is often a different filesystem such as tmpfs).
+    with tempfile.TemporaryDirectory(dir=target_path.parent, prefix=".docs_tmp_") as temp_dir_str:
         temp_path = Path(temp_dir_str)
         logger.info(f"   📂 Created temporary workspace at {temp_path}.")
 
@@ -382,13 +521,24 @@ async def run_openapi_indexing_pipeline(providers: list[str] | None = None) -> N
         # Copy troubleshooting guides and create listing
         generate_troubleshooting_guides(temp_path)
 
-        # Process each provider's spec
+        # Process each provider's spec; providers write to disjoint subdirectories,
+        # so their documentation can be generated concurrently
+        tasks = []
         for provider, spec in provider_specs.items():
             if not spec.paths:
                 logger.info(f"   ⏭️  Skipping {provider} - no paths found.")
                 continue
 
-            await process_provider_documentation(spec, provider, temp_path, target_path)
+            # Skip regeneration entirely when the fetched spec is identical to the last run
+            if _reuse_existing_provider_docs(spec, provider, temp_path, target_path):
+                continue
+
+            tasks.append(process_provider_documentation(spec, provider, temp_path, target_path))
+
+        if tasks:
+            async with asyncio.TaskGroup() as tg:
+                for task in tasks:
+                    tg.create_task(task)
 
         logger.info("   🗂️  Generated all provider-specific documents and schemas.")
 
@@ -1,23 +1,35 @@
 #!/usr/bin/env python3
 """Utility functions for the OpenAPI indexing pipeline_config."""
 
+import ctypes
 import json
+import mmap
+import os
 import re
 import shutil
+import sys
+import uuid
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import aiofiles
 import yaml
 from fastmcp.utilities.logging import get_logger
 
 from .models import file_constants
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup, stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
+
 logger = get_logger(__name__)
 
 _FRONT_MATTER_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n?", re.DOTALL)
 
 
-def write_json_file(file_path: Path, data: Any, ensure_ascii: bool = False) -> None:
+def write_json_file(file_path: Path, data: Any, ensure_ascii: bool = False, indent: bool = True) -> None:
     """
     Write JSON data to a file with consistent formatting.
 
@@ -25,11 +37,48 @@ def write_json_file(file_path: Path, data: Any, ensure_ascii: bool = False) -> N
         file_path: Path to write the file
         data: Data to serialize as JSON
         ensure_ascii: Whether to ensure ASCII encoding
+        indent: Whether to pretty-print; machine-read artifacts pass False
+            for compact output
+    """
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    payload = _serialize_json(data, ensure_ascii, indent)
+    # Write to a uniquely named sibling temp file and rename so readers never see
+    # partial output and concurrent writers of one destination cannot collide
+    tmp_path = _tmp_sibling(file_path)
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, file_path)
+
+
+def _tmp_sibling(file_path: Path) -> Path:
+    """Return a unique temp path next to file_path for an atomic replace."""
+    return file_path.with_name(f"{file_path.name}.{uuid.uuid4().hex}.tmp")
+
+
+def _serialize_json(data: Any, ensure_ascii: bool, indent: bool) -> bytes:
+    if orjson is not None and not ensure_ascii and (not indent or file_constants.JSON_INDENT == 2):
+        option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    indent_width = file_constants.JSON_INDENT if indent else None
+    return (json.dumps(data, ensure_ascii=ensure_ascii, indent=indent_width) + "\n").encode("utf-8")
+
+
+async def write_json_file_async(file_path: Path, data: Any, ensure_ascii: bool = False, indent: bool = True) -> None:
+    """
+    Async variant of write_json_file for generators that fan out many writes.
+
+    Args:
+        file_path: Path to write the file
+        data: Data to serialize as JSON
+        ensure_ascii: Whether to ensure ASCII encoding
+        indent: Whether to pretty-print; machine-read artifacts pass False
+            for compact output
     """
     file_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=ensure_ascii, indent=file_constants.JSON_INDENT)
-        f.write("\n")
+    payload = _serialize_json(data, ensure_ascii, indent)
+    tmp_path = _tmp_sibling(file_path)
+    async with aiofiles.open(tmp_path, "wb") as f:
+        await f.write(payload)
+    os.replace(tmp_path, file_path)
 
 
 def read_json_file(file_path: Path) -> dict[str, Any]:
@@ -46,6 +95,8 @@ def read_json_file(file_path: Path) -> dict[str, Any]:
         FileNotFoundError: If file doesn't exist
         json.JSONDecodeError: If file contains invalid JSON
     """
+    if orjson is not None:
+        return orjson.loads(file_path.read_bytes())
     with open(file_path, "r", encoding="utf-8") as f:
         return json.load(f)
 
@@ -59,10 +110,10 @@ def write_markdown_file(file_path: Path, content: str) -> None:
         content: Markdown content
     """
     file_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(content)
-        if not content.endswith("\n"):
-            f.write("\n")
+    if not content.endswith("\n"):
+        content += "\n"
+    # One encode + one write; skips the TextIOWrapper buffering layer
+    file_path.write_bytes(content.encode("utf-8"))
 
 
 def safe_remove_directory(path: Path) -> bool:
@@ -114,8 +165,22 @@ def compare_json_files(file1: Path, file2: Path) -> bool:
         if not (file1.exists() and file2.exists()):
             return False
 
-        with open(file1, "r", encoding="utf-8") as f1, open(file2, "r", encoding="utf-8") as f2:
-            return json.load(f1) == json.load(f2)
+        # Byte-identical files are semantically equal; memory-map both and let
+        # memcmp decide before paying for a full JSON parse.
+        size = file1.stat().st_size
+        if size == file2.stat().st_size:
+            if size == 0:
+                return True
+            with (
+                open(file1, "rb") as f1,
+                open(file2, "rb") as f2,
+                mmap.mmap(f1.fileno(), 0, access=mmap.ACCESS_READ) as map1,
+                mmap.mmap(f2.fileno(), 0, access=mmap.ACCESS_READ) as map2,
+            ):
+                if memoryview(map1) == memoryview(map2):
+                    return True
+
+        return read_json_file(file1) == read_json_file(file2)
     except (json.JSONDecodeError, OSError) as e:
         logger.warning(f"Could not compare {file1} and {file2}: {e}")
         return False
@@ -125,12 +190,23 @@ def load_markdown_with_front_matter(file_path: Path) -> tuple[dict[str, Any], st
     """
     Load a markdown file and split optional YAML front matter from the body.
 
+    Results are cached per (path, mtime) so repeated tool calls during a
+    session skip both the file read and the front-matter parse.
+
     Args:
         file_path: Path to the markdown file
 
     Returns:
         Tuple of (metadata dict, markdown body without front matter)
     """
+    metadata, body = _load_markdown_cached(str(file_path), file_path.stat().st_mtime_ns)
+    # Hand out a copy of the metadata so callers can't mutate the cached entry
+    return dict(metadata), body
+
+
+@lru_cache(maxsize=256)
+def _load_markdown_cached(path_str: str, mtime_ns: int) -> tuple[dict[str, Any], str]:
+    file_path = Path(path_str)
     text = file_path.read_text(encoding="utf-8")
     metadata: dict[str, Any] = {}
     body = text
@@ -140,20 +216,51 @@ def load_markdown_with_front_matter(file_path: Path) -> tuple[dict[str, Any], st
         front_matter_text = match.group(1)
         body = text[match.end() :]
 
-        try:
-            loaded = yaml.safe_load(front_matter_text) or {}
-            if isinstance(loaded, dict):
-                metadata = loaded
-            else:
-                logger.warning(f"Front matter in {file_path} is not a mapping; ignoring metadata.")
-        except yaml.YAMLError as exc:  # pragma: no cover - defensive guard
-            logger.warning(f"Failed to parse front matter in {file_path}: {exc}")
+        parsed = _parse_simple_front_matter(front_matter_text)
+        if parsed is not None:
+            metadata = parsed
+        else:
+            try:
+                loaded = yaml.safe_load(front_matter_text) or {}
+                if isinstance(loaded, dict):
+                    metadata = loaded
+                else:
+                    logger.warning(f"Front matter in {file_path} is not a mapping; ignoring metadata.")
+            except yaml.YAMLError as exc:  # pragma: no cover - defensive guard
+                logger.warning(f"Failed to parse front matter in {file_path}: {exc}")
 
         body = body.lstrip("\n")
 
     return metadata, body
 
 
+def _parse_simple_front_matter(front_matter_text: str) -> dict[str, Any] | None:
+    """
+    Parse flat `key: value` front matter without invoking PyYAML.
+
+    Returns None when the block uses YAML features the scanner can't handle
+    (nesting, lists, quoting, anchors, typed scalars), so the caller falls
+    back to yaml.safe_load. Template front matter is flat string pairs, which
+    keeps the slow parser off the tools' hot path.
+    """
+    metadata: dict[str, Any] = {}
+    for line in front_matter_text.splitlines():
+        if not line.strip():
+            continue
+        if line[0].isspace() or line.startswith("-"):
+            return None
+        key, sep, value = line.partition(":")
+        if not sep:
+            return None
+        value = value.strip()
+        if not value or value[0] in "{[|>&*'\"" or "#" in value:
+            return None
+        if value in {"true", "false", "null", "~"} or value.lstrip("+-").replace(".", "", 1).isdigit():
+            return None  # let YAML coerce non-string scalars
+        metadata[key.strip()] = value
+    return metadata
+
+
 def copy_file_if_exists(source: Path, destination: Path) -> bool:
     """
     Copy a file if it exists.
@@ -215,15 +322,27 @@ def sanitize_path_for_filename(provider: str, path: str) -> str:
     return path.replace("/", "_")
 
 
+_MARKDOWN_TABLE_TRANSLATION = str.maketrans({"|": "\\|", "\n": " ", "\r": " "})
+
+
 def escape_markdown_table_content(text: str) -> str:
-    return text.replace("|", "\\|").replace("\n", " ").replace("\r", " ")
+    return text.translate(_MARKDOWN_TABLE_TRANSLATION)
 
 
-def get_provider_from_path(path: str) -> str:
+@lru_cache(maxsize=1)
+def _provider_prefixes() -> tuple[tuple[str, str], ...]:
+    """Build the (path_prefix, provider) dispatch table once per process."""
     from ..config import settings
 
-    for provider_name, provider_config in settings.pipeline_config.provider_configs.items():
-        if path.startswith(provider_config.path_prefix):
+    return tuple(
+        (provider_config.path_prefix, provider_name)
+        for provider_name, provider_config in settings.pipeline_config.provider_configs.items()
+    )
+
+
+def get_provider_from_path(path: str) -> str:
+    for prefix, provider_name in _provider_prefixes():
+        if path.startswith(prefix):
             return provider_name
     return "omelet"
 
@@ -293,7 +412,51 @@ def validate_docs_exist(docs_dir: Path | None = None) -> bool:
     return True
 
 
+# renameat2 flags/constants from linux/fs.h; the syscall is not exposed by os
+_RENAME_EXCHANGE = 2
+_AT_FDCWD = -100
+
+
+def _load_renameat2() -> Any | None:
+    if sys.platform != "linux":
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        return libc.renameat2
+    except (OSError, AttributeError):  # pragma: no cover - platform dependent
+        return None
+
+
+_renameat2 = _load_renameat2()
+
+
+def _exchange_directories(source: Path, target: Path) -> bool:
+    """
+    Atomically swap two directories via renameat2(RENAME_EXCHANGE).
+
+    Returns:
+        True if the swap happened, False if the syscall is unavailable or failed
+        (e.g. unsupported filesystem), in which case callers should fall back.
+    """
+    if _renameat2 is None:
+        return False
+
+    result = _renameat2(_AT_FDCWD, os.fsencode(source), _AT_FDCWD, os.fsencode(target), _RENAME_EXCHANGE)
+    if result != 0:
+        logger.debug(f"renameat2 exchange unavailable for {target}: {os.strerror(ctypes.get_errno())}")
+        return False
+    return True
+
+
 def atomic_directory_replace(source: Path, target: Path) -> bool:
+    # Fast path: a single atomic swap with no backup phase and no rollback window.
+    if target.exists() and _exchange_directories(source, target):
+        try:
+            shutil.rmtree(source)  # source now holds the previous version
+        except OSError as cleanup_error:
+            logger.warning(f"Failed to cleanup previous version at {source}: {cleanup_error}")
+        return True
+
     backup = target.with_suffix(".backup")
     replacement_succeeded = False
 
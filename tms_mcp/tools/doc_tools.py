@@ -3,11 +3,17 @@
 import json
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Annotated
 
 from fastmcp.exceptions import ToolError
 
+try:  # Prefer orjson for parsing/formatting doc JSON; stdlib json works everywhere
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+
 from tms_mcp.config import settings
 from tms_mcp.pipeline.utils import get_provider_from_path, load_markdown_with_front_matter
 from tms_mcp.server import mcp
@@ -24,6 +30,7 @@ from tms_mcp.tools.models import (
 provider_configs = settings.pipeline_config.provider_configs
 
 
+@lru_cache(maxsize=1)
 def _get_docs_dir() -> Path:
     """Get the docs directory path."""
     return Path(__file__).parent.parent / "docs"
@@ -39,9 +46,14 @@ def _get_troubleshooting_dir() -> Path:
     return _get_docs_dir() / "troubleshooting"
 
 
-_get_provider_from_path = get_provider_from_path
+# Endpoint paths form a small, fixed set per docs generation, so these per-call
+# string manipulations are memoized with near-perfect hit rates.
+_get_provider_from_path = lru_cache(maxsize=512)(get_provider_from_path)
+
+_SLASH_TO_UNDERSCORE = str.maketrans("/", "_")
 
 
+@lru_cache(maxsize=512)
 def _path_to_path_id(path: str, provider: str | None = None) -> str:
     """
     Convert API path to path_id format based on provider configuration.
@@ -61,22 +73,32 @@ def _path_to_path_id(path: str, provider: str | None = None) -> str:
     provider_config = provider_configs.get(provider)
     if not provider_config:
         # Fallback to default behavior
-        return "_".join(path.strip("/").split("/"))
+        return path.strip("/").translate(_SLASH_TO_UNDERSCORE)
 
-    # Remove the provider's path prefix
+    # Remove the provider's path prefix, then convert in one C-level pass
     prefix = provider_config.path_prefix
-    if path.startswith(prefix):
-        endpoint_name = path[len(prefix) :].strip("/")
-    else:
-        endpoint_name = path.strip("/")
+    endpoint_name = path[len(prefix) :] if path.startswith(prefix) else path
+    return endpoint_name.strip("/").translate(_SLASH_TO_UNDERSCORE)
+
 
-    return endpoint_name.replace("/", "_")
+# Docs only change when the pipeline reruns, but tools are called many times per
+# agent session; cache file contents keyed by mtime so unchanged files are read once.
+_TEXT_CACHE: dict[Path, tuple[int, str]] = {}
+_JSON_CACHE: dict[Path, tuple[int, str]] = {}
 
 
 def _read_text_file(file_path: Path) -> str:
     try:
-        with open(file_path, "r", encoding="utf-8") as file:
-            return file.read()
+        mtime_ns = file_path.stat().st_mtime_ns
+        cached = _TEXT_CACHE.get(file_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        # Read bytes and decode once; the TextIOWrapper's incremental decoder is
+        # needless overhead for small files read whole
+        with open(file_path, "rb") as file:
+            content = file.read().decode("utf-8")
+        _TEXT_CACHE[file_path] = (mtime_ns, content)
+        return content
     except FileNotFoundError:
         raise ToolError(f"File not found: {file_path.name}")
     except PermissionError:
@@ -87,9 +109,19 @@ def _read_text_file(file_path: Path) -> str:
 
 def _read_json_file(file_path: Path, file_type: str, path: str, path_id: str) -> str:
     try:
-        with open(file_path, "r", encoding="utf-8") as file:
-            json_data = json.load(file)
-            return json.dumps(json_data, indent=2, ensure_ascii=False)
+        mtime_ns = file_path.stat().st_mtime_ns
+        cached = _JSON_CACHE.get(file_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        with open(file_path, "rb") as file:
+            raw = file.read()
+        # Cache the already-formatted output so repeat calls skip parse and dump alike
+        if orjson is not None:
+            formatted = orjson.dumps(orjson.loads(raw), option=orjson.OPT_INDENT_2).decode()
+        else:
+            formatted = json.dumps(json.loads(raw), indent=2, ensure_ascii=False)
+        _JSON_CACHE[file_path] = (mtime_ns, formatted)
+        return formatted
     except FileNotFoundError:
         raise ToolError(f"{file_type.capitalize()} for '{path}' (path_id: {path_id}) not found")
     except json.JSONDecodeError as e:
@@ -111,6 +143,10 @@ def _validate_provider(provider: str) -> str:
     Raises:
         ToolError: If provider is not in the allowed list
     """
+    if provider in provider_configs:
+        # Fast path: callers almost always pass the canonical lowercase name
+        return provider
+
     normalized = provider.strip().lower()
     if normalized not in provider_configs:
         valid_providers = ", ".join(sorted(provider_configs.keys()))
@@ -151,25 +187,27 @@ def _get_json_file_content(path: str, provider: str | None, file_subpath: str, f
         JSON content or error message
     """
     resolved_provider, path_id = _resolve_provider_and_path_id(path, provider)
-    file_path = _get_docs_dir() / resolved_provider / file_subpath / f"{path_id}.json"
+    # One f-string instead of chained Path joins; this runs on every JSON tool call
+    file_path = Path(f"{_get_docs_dir()}/{resolved_provider}/{file_subpath}/{path_id}.json")
     return _read_json_file(file_path, file_type, path, path_id)
 
 
+# Matches any "." or ".." path segment in a single pass
+_UNSAFE_DOC_SEGMENT = re.compile(r"(?:^|/)\.\.?(?:/|$)")
+
+
 def _sanitize_document_id(document_id: str) -> list[str] | None:
     """Validate and normalize a nested document identifier."""
 
     if not document_id:
         return None
 
-    parts = [part for part in document_id.strip().split("/") if part]
-    if not parts:
+    normalized = document_id.strip()
+    if not normalized or _UNSAFE_DOC_SEGMENT.search(normalized):
         return None
 
-    for part in parts:
-        if part in {".", ".."}:
-            return None
-
-    return parts
+    parts = [part for part in normalized.split("/") if part]
+    return parts or None
 
 
 def _read_integration_pattern(pattern_id: str) -> tuple[str, Path]:
@@ -242,6 +280,16 @@ def _mask_api_key(key: str) -> str:
     return f"{key[:4]}...{key[-4:]}"
 
 
+def _redact_api_keys(content: str) -> str:
+    """Mask any *_API_KEY environment values appearing in content in a single pass."""
+    keys = {value: _mask_api_key(value) for name, value in os.environ.items() if name.endswith("_API_KEY") and value}
+    if not keys:
+        return content
+    # Longest-first alternation avoids partial matches when one key prefixes another
+    pattern = re.compile("|".join(re.escape(value) for value in sorted(keys, key=len, reverse=True)))
+    return pattern.sub(lambda match: keys[match.group(0)], content)
+
+
 @mcp.tool
 def get_basic_info() -> str:
     """
@@ -249,7 +297,7 @@ def get_basic_info() -> str:
     Includes masked user-provided API keys.
     """
     file_path = _get_docs_dir() / "basic_info.md"
-    content = _read_text_file(file_path)
+    content = _redact_api_keys(_read_text_file(file_path))
     inavi_key = os.getenv("INAVI_API_KEY")
     omelet_key = os.getenv("OMELET_API_KEY")
     if inavi_key:
@@ -386,12 +434,12 @@ def list_endpoints(
 
     for provider_name in providers_to_check:
         file_path = docs_dir / provider_name / "endpoints_summary.md"
-        if file_path.exists():
-            try:
-                content = _read_text_file(file_path)
-                all_endpoints.extend(_parse_endpoints_markdown(content))
-            except ToolError:
-                continue
+        try:
+            content = _read_text_file(file_path)
+        except ToolError:
+            # Missing summary for a provider is expected when its docs were never generated
+            continue
+        all_endpoints.extend(_parse_endpoints_markdown(content))
 
     if not all_endpoints:
         raise ToolError("No endpoints found. Try restarting the server or run 'update-docs'.")
@@ -443,13 +491,26 @@ def get_response_schema(
         JSON schema content for the response
     """
     resolved_provider, path_id = _resolve_provider_and_path_id(path, provider)
-    file_path = _get_docs_dir() / resolved_provider / "schemas" / "response" / path_id / f"{response_code}.json"
+    file_path = Path(f"{_get_docs_dir()}/{resolved_provider}/schemas/response/{path_id}/{response_code}.json")
     return _read_json_file(file_path, f"response schema (code: {response_code})", path, path_id)
 
 
 _VALID_EXAMPLE_TYPES = {"request", "response", "both"}
 
 
+def _scan_json_stems(directory: Path) -> list[str]:
+    """List sorted stems of .json files using cached dirent data (no per-file stat)."""
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(
+                entry.name[:-5]
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
 @mcp.tool
 def list_examples(
     path: Annotated[str, "API endpoint path (e.g., '/api/vrp', '/api/cost-matrix')"],
@@ -474,18 +535,21 @@ def list_examples(
     response_examples: dict[str, list[str]] = {}
 
     if example_type in ["request", "both"]:
-        request_dir = docs_dir / "request_body" / path_id
-        if request_dir.exists() and request_dir.is_dir():
-            request_examples = sorted([f.stem for f in request_dir.glob("*.json")])
+        request_examples = _scan_json_stems(docs_dir / "request_body" / path_id)
 
     if example_type in ["response", "both"]:
         response_dir = docs_dir / "response_body" / path_id
-        if response_dir.exists() and response_dir.is_dir():
-            for code_dir in response_dir.iterdir():
-                if code_dir.is_dir() and code_dir.name.isdigit():
-                    code_examples = sorted([f.stem for f in code_dir.glob("*.json")])
-                    if code_examples:
-                        response_examples[code_dir.name] = code_examples
+        try:
+            with os.scandir(response_dir) as entries:
+                code_dirs = [
+                    entry.name for entry in entries if entry.name.isdigit() and entry.is_dir(follow_symlinks=False)
+                ]
+        except (FileNotFoundError, NotADirectoryError):
+            code_dirs = []
+        for code in code_dirs:
+            code_examples = _scan_json_stems(response_dir / code)
+            if code_examples:
+                response_examples[code] = code_examples
 
     return ExamplesListResult(
         endpoint=path,